@@ -16,8 +16,17 @@ Használat:
 
 Szükséges környezeti változók:
 - GOOGLE_TEST_CREDENTIALS: Google Cloud credentials (STT-hez)
+
+Opcionális környezeti változók:
+- SILERO_VAD_MODEL_PATH: saját Silero VAD ONNX modell (pl. int8 kvantált silero_vad.int8.onnx)
+- SILERO_VAD_BACKEND: `openvino` esetén a VAD az OpenVINO execution provideren fut (Intel CPU)
+- CONFAI_STREAM_URL: WebSocket végpont a confai append-ekhez (alapértelmezés: HTTP POST)
+
+Ha a `uvloop` csomag telepítve van, azt használja event loop-ként; ha az
+`orjson` telepítve van, azzal készül a JSON (különben a beépített `json`).
 """
 
+import asyncio
 import os
 
 from dotenv import load_dotenv
@@ -25,6 +34,18 @@ from loguru import logger
 import time
 import aiohttp
 
+# orjson is faster, but it isn't a pipecat dependency: fall back to the stdlib
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ModuleNotFoundError:
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
 from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.audio.vad.vad_analyzer import VADParams
 from pipecat.frames.frames import (
@@ -51,6 +72,18 @@ from pipecat.transports.websocket.fastapi import FastAPIWebsocketParams
 
 load_dotenv(override=True)
 
+# Resolved once: the append helper runs for every transcription.
+_CONFAI_KEY = os.getenv("CONFAI_API_KEY")
+_CONFAI_AUTH_HEADERS = {"X-Admin-Key": _CONFAI_KEY} if _CONFAI_KEY else {}
+_CONFAI_HEADERS = {**_CONFAI_AUTH_HEADERS, "Content-Type": "application/json"}
+if not _CONFAI_KEY:
+    logger.error("CONFAI_API_KEY not set — POSTing without X-Admin-Key header")
+
+# Optional streaming endpoint for appends (e.g.
+# wss://confai.telekom.hu/api/transcription/stream). Needs server support, so
+# appends are POSTed unless this is set.
+_CONFAI_STREAM_URL = os.getenv("CONFAI_STREAM_URL")
+
 
 async def send_frontend_message(task: PipelineTask, *, text: str | None = None, payload: dict | None = None, user_message: bool = True, level: str = "info"):
     """Send a structured message to the frontend and log to console.
@@ -67,30 +100,126 @@ async def send_frontend_message(task: PipelineTask, *, text: str | None = None,
         payload = {"text": text or "", "type": level}
 
     # Log to console according to level
-    try:
-        if level == "error" or payload.get("type") == "error":
-            logger.error(f"Frontend message: {payload}")
-        else:
-            logger.info(f"Frontend message: {payload}")
-    except Exception:
-        logger.exception("Failed to log frontend message")
+    if level == "error" or payload.get("type") == "error":
+        logger.error(f"Frontend message: {payload}")
+    else:
+        logger.info(f"Frontend message: {payload}")
 
     # Queue transport frame(s)
+    frames = [OutputTransportMessageFrame(message=payload)]
+    if user_message:
+        user_text = text if text is not None else payload.get("text", str(payload))
+        frames.append(UserTextFrame(text=user_text))
     try:
-        await task.queue_frame(OutputTransportMessageFrame(message=payload))
-        if user_message:
-            user_text = text if text is not None else payload.get("text", str(payload))
-            await task.queue_frame(UserTextFrame(text=user_text))
+        await task.queue_frames(frames)
     except Exception:
         logger.exception("Failed to queue frontend frames")
 
 
+# Statuses meaning the server didn't process the request, so it's safe to resend
+_CONFAI_RETRY_STATUSES = (429, 503)
+
+
+async def _post_confai(
+    http: aiohttp.ClientSession, url: str, payload: dict, attempts: int = 3
+) -> aiohttp.ClientResponse:
+    """POST `payload` to a confai endpoint, retrying transient failures.
+
+    Only failures that mean the request wasn't processed are retried, with
+    exponential backoff (0.2s, 0.4s, ...): 429/503 responses and failures to
+    connect. The endpoints aren't idempotent, so anything else that reached
+    the server (other 5xx, read timeouts) is not resent: a second `start`
+    would open another session and a second `append` would duplicate the
+    batch. After the last attempt the response is returned, or the error
+    raised, so callers handle it as before.
+    """
+    data = _json_dumps(payload)
+    for attempt in range(attempts):
+        last_attempt = attempt == attempts - 1
+        try:
+            resp = await http.post(url, data=data, headers=_CONFAI_HEADERS)
+            if resp.status not in _CONFAI_RETRY_STATUSES or last_attempt:
+                return resp
+            logger.warning(f"confai {url} returned HTTP {resp.status}, retrying")
+            resp.close()
+        except (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError) as e:
+            if last_attempt:
+                raise
+            logger.warning(f"confai {url} request failed ({e}), retrying")
+        await asyncio.sleep(0.2 * 2**attempt)
+
+
+async def _open_confai_stream(task: PipelineTask, session_id: str):
+    """Open the append WebSocket for `session_id` if `CONFAI_STREAM_URL` is set.
+
+    Delivery over the stream is not acknowledged by the server. On failure
+    appends keep using the HTTP endpoint.
+    """
+    if not _CONFAI_STREAM_URL:
+        return
+
+    try:
+        ws = await task._http.ws_connect(
+            _CONFAI_STREAM_URL,
+            params={"session_id": session_id},
+            headers=_CONFAI_AUTH_HEADERS,
+            heartbeat=30,
+        )
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.warning(f"Could not open confai append stream ({e}); falling back to HTTP appends")
+        return
+
+    task._confai_ws = ws
+    task._confai_ws_reader = asyncio.create_task(_read_confai_stream(task, ws))
+    logger.info(f"Opened confai append stream for session {session_id}")
+
+
+async def _read_confai_stream(task: PipelineTask, ws: aiohttp.ClientWebSocketResponse):
+    """Read from the append WebSocket for as long as it's open.
+
+    aiohttp only answers pings, resets the heartbeat and processes close
+    frames while someone is receiving, so the stream needs a reader even
+    though the server doesn't send anything we use. Once the stream ends,
+    appends fall back to the HTTP endpoint.
+    """
+    try:
+        async for msg in ws:
+            if msg.type == aiohttp.WSMsgType.ERROR:
+                logger.warning(f"confai append stream error: {ws.exception()}")
+                break
+            logger.debug(f"confai append stream message: {msg.data}")
+    except aiohttp.ClientError as e:
+        logger.warning(f"confai append stream failed ({e})")
+
+    if task._confai_ws is ws:
+        logger.warning("confai append stream closed; falling back to HTTP appends")
+        task._confai_ws = None
+    if not ws.closed:
+        await ws.close()
+
+
+async def _close_confai_stream(task: PipelineTask):
+    """Stop the stream reader and close the append WebSocket, if any."""
+    ws = task._confai_ws
+    reader = task._confai_ws_reader
+    task._confai_ws = None
+    task._confai_ws_reader = None
+    if reader is not None:
+        reader.cancel()
+        try:
+            await reader
+        except asyncio.CancelledError:
+            pass
+    if ws is not None and not ws.closed:
+        await ws.close()
+
+
 async def start_confai_transcription(task: PipelineTask) -> str | None:
     """Start a remote transcription session at confai and notify UI.
 
-    Returns the `session_id` on success or `None` on failure. On failure
-    this helper will also queue error frames to the pipeline and cancel the
-    given `task`.
+    Returns the `session_id` on success or `None` on failure. Transient
+    errors are retried first (see `_post_confai`); on failure this helper
+    will also queue error frames to the pipeline and cancel the given `task`.
     """
     url = "https://confai.telekom.hu/api/transcription/start"
     timestamp = int(time.time())
@@ -99,66 +228,55 @@ async def start_confai_transcription(task: PipelineTask) -> str | None:
         "source_identifier": "2026-konferencia",
     }
 
-    confai_key = os.getenv("CONFAI_API_KEY")
-    if confai_key:
-        headers = {"X-Admin-Key": confai_key}
-    else:
-        headers = {}
-        logger.error("CONFAI_API_KEY not set — POSTing without X-Admin-Key header")
-
     try:
-        async with aiohttp.ClientSession() as http:
-            logger.info(f"📤 POSTing to confai transcription/start endpoint... {headers}")
-            resp = await http.post(url, json=payload, headers=headers)
-            if resp.status != 200:
-                err_text = f"Failed to start remote transcription session: HTTP {resp.status}"
-                # Try to read response body for more details and log it
-                try:
-                    resp_text = await resp.text()
-                except Exception:
-                    resp_text = None
-                logger.error(err_text)
-                if resp_text:
-                    logger.error(f"Response body: {resp_text}")
-                try:
-                    await send_frontend_message(task, text=err_text, user_message=True, level="error")
-                    await task.queue_frame(ErrorFrame(error=err_text, fatal=True))
-                except Exception:
-                    logger.exception("Failed to queue error frames")
-                await task.cancel()
-                return None
-
-            body = await resp.json()
-            session_id = body.get("session_id")
-            if session_id:
-                task._remote_transcription = {"session_id": session_id, "raw": body}
-                logger.info(f"Started remote transcription session: {session_id}")
-                # Send filename and source_identifier to frontend as a structured message
-                try:
-                    meta_payload = {
-                        "filename": payload["filename"],
-                        "source_identifier": payload["source_identifier"],
-                        "type": "session_start",
-                    }
-                    await send_frontend_message(task, payload=meta_payload, user_message=False, level="info")
-                except Exception:
-                    logger.exception("Failed to queue session metadata frame")
-                try:
-                    info_text = f"Kapcsolat létrejött a https://confai.telekom.hu/ szolgáltatással. session_id: {session_id}"
-                    await send_frontend_message(task, text=info_text, user_message=True, level="chat")
-                except Exception:
-                    logger.exception("Failed to queue session info frames")
-                return session_id
-            else:
-                err_text = f"Remote transcription start returned no session_id: {body}"
-                logger.error(err_text)
-                try:
-                    await send_frontend_message(task, text=err_text, user_message=True, level="error")
-                    await task.queue_frame(ErrorFrame(error=err_text, fatal=True))
-                except Exception:
-                    logger.exception("Failed to queue error frames")
-                await task.cancel()
-                return None
+        http = task._http
+        logger.info(f"📤 POSTing to confai transcription/start endpoint... {_CONFAI_HEADERS}")
+        resp = await _post_confai(http, url, payload)
+        if resp.status != 200:
+            err_text = f"Failed to start remote transcription session: HTTP {resp.status}"
+            # Try to read response body for more details and log it
+            try:
+                resp_text = await resp.text()
+            except Exception:
+                resp_text = None
+            logger.error(err_text)
+            if resp_text:
+                logger.error(f"Response body: {resp_text}")
+            try:
+                await send_frontend_message(task, text=err_text, user_message=True, level="error")
+                await task.queue_frame(ErrorFrame(error=err_text, fatal=True))
+            except Exception:
+                logger.exception("Failed to queue error frames")
+            await task.cancel()
+            return None
+
+        body = _json_loads(await resp.read())
+        session_id = body.get("session_id")
+        if session_id:
+            task._session_id = session_id
+            logger.info(f"Started remote transcription session: {session_id}")
+            await _open_confai_stream(task, session_id)
+            # Send filename and source_identifier to frontend as a structured message,
+            # followed by a chat message with the session id
+            meta_payload = {
+                "filename": payload["filename"],
+                "source_identifier": payload["source_identifier"],
+                "type": "session_start",
+            }
+            info_text = f"Kapcsolat létrejött a https://confai.telekom.hu/ szolgáltatással. session_id: {session_id}"
+            await send_frontend_message(task, payload=meta_payload, user_message=False, level="info")
+            await send_frontend_message(task, text=info_text, user_message=True, level="chat")
+            return session_id
+        else:
+            err_text = f"Remote transcription start returned no session_id: {body}"
+            logger.error(err_text)
+            try:
+                await send_frontend_message(task, text=err_text, user_message=True, level="error")
+                await task.queue_frame(ErrorFrame(error=err_text, fatal=True))
+            except Exception:
+                logger.exception("Failed to queue error frames")
+            await task.cancel()
+            return None
     except Exception as e:
         err_text = f"Error starting remote transcription session: {e}"
         logger.exception(err_text)
@@ -174,133 +292,156 @@ async def start_confai_transcription(task: PipelineTask) -> str | None:
 async def finalize_confai_transcription(task: PipelineTask) -> bool:
     """Finalize a remote transcription session at confai using saved session_id.
 
-    Posts {"session_id": "..."} to the finalize endpoint with X-Admin-Key header.
-    Returns True on success, False otherwise. Not fatal — used during disconnect.
+    Closes the append stream (if open) and posts {"session_id": "..."} to the
+    finalize endpoint with X-Admin-Key header. Returns True on success, False
+    otherwise. Not fatal — used during disconnect.
     """
-    if not hasattr(task, "_remote_transcription") or not task._remote_transcription:
+    session_id = task._session_id
+    if not session_id:
         logger.error("No remote transcription session stored on task; nothing to finalize")
         return False
 
-    session_id = task._remote_transcription.get("session_id")
-    if not session_id:
-        logger.error("Remote transcription session info missing session_id; nothing to finalize")
-        return False
+    try:
+        await _close_confai_stream(task)
+    except Exception:
+        logger.exception("Failed to close confai append stream")
 
     url = "https://confai.telekom.hu/api/transcription/finalize"
     payload = {"session_id": session_id}
-    confai_key = os.getenv("CONFAI_API_KEY")
-    headers = {"X-Admin-Key": confai_key} if confai_key else {}
 
     try:
-        async with aiohttp.ClientSession() as http:
-            resp = await http.post(url, json=payload, headers=headers)
+        http = task._http
+        resp = await _post_confai(http, url, payload)
+        async with resp:
             if resp.status != 200:
                 err_text = f"Failed to finalize remote transcription session: HTTP {resp.status}"
                 logger.error(err_text)
-                try:
-                    await send_frontend_message(task, text=err_text, user_message=True, level="error")
-                except Exception:
-                    logger.exception("Failed to queue finalize error frames")
+                await send_frontend_message(task, text=err_text, user_message=True, level="error")
                 return False
 
-            body = await resp.json()
+            body = _json_loads(await resp.read())
             logger.info(f"Finalized remote transcription session {session_id}: {body}")
-            try:
-                info_text = f"A távoli átírás befejeződött. session_id: {session_id}"
-                info_msg = OutputTransportMessageFrame(message={"text": info_text, "type": "chat"})
-                await task.queue_frame(info_msg)
-                info_user = UserTextFrame(text=info_text)
-                await task.queue_frame(info_user)
-            except Exception:
-                logger.exception("Failed to queue finalize info frames")
+            info_text = f"A távoli átírás befejeződött. session_id: {session_id}"
+            await send_frontend_message(task, text=info_text, user_message=True, level="chat")
             return True
     except Exception as e:
         err_text = f"Error finalizing remote transcription session: {e}"
         logger.exception(err_text)
-        try:
-            await send_frontend_message(task, text=err_text, user_message=True, level="error")
-        except Exception:
-            logger.exception("Failed to queue finalize exception frames")
+        await send_frontend_message(task, text=err_text, user_message=True, level="error")
         return False
 
 
-async def append_confai_transcription(task: PipelineTask, content: str) -> bool:
+async def append_confai_transcription(task: PipelineTask, session_id: str, content: str) -> bool:
     """Append a piece of transcribed content to the remote confai session.
 
-    Posts {"session_id": "...", "content": "..."} to the append endpoint.
-    Returns True on success, False otherwise.
+    Sends {"content": "..."} over the append stream when one is open (not
+    acknowledged by the server), otherwise posts {"session_id": "...",
+    "content": "..."} to the append endpoint. Returns True on success, False
+    otherwise.
     """
-    if not hasattr(task, "_remote_transcription") or not task._remote_transcription:
-        logger.debug("No remote transcription session stored on task; skipping append")
-        return False
-
-    session_id = task._remote_transcription.get("session_id")
-    if not session_id:
-        logger.debug("Remote transcription session missing session_id; skipping append")
-        return False
+    ws = task._confai_ws
+    if ws is not None and not ws.closed:
+        try:
+            await ws.send_str(_json_dumps({"content": content}).decode())
+            logger.debug(f"Streamed content to session {session_id}")
+            return True
+        except (aiohttp.ClientError, ConnectionError) as e:
+            logger.warning(f"confai append stream failed ({e}); falling back to HTTP appends")
+            task._confai_ws = None
 
     url = "https://confai.telekom.hu/api/transcription/append"
     payload = {"session_id": session_id, "content": content}
-    confai_key = os.getenv("CONFAI_API_KEY")
-    headers = {"X-Admin-Key": confai_key} if confai_key else {}
 
     try:
-        async with aiohttp.ClientSession() as http:
-            resp = await http.post(url, json=payload, headers=headers)
+        http = task._http
+        resp = await _post_confai(http, url, payload)
+        async with resp:
             if resp.status != 200:
                 err_text = f"Failed to append to remote transcription session: HTTP {resp.status}"
                 logger.error(err_text)
-                try:
-                    await send_frontend_message(task, text=err_text, user_message=False, level="error")
-                except Exception:
-                    logger.exception("Failed to queue append error frame")
+                await send_frontend_message(task, text=err_text, user_message=False, level="error")
                 return False
 
-            body = await resp.json()
-            logger.debug(f"Appended content to session {session_id}: {body}")
+            # Nothing in the append response is needed, so skip JSON parsing.
+            # The body is still drained: aiohttp closes connections released
+            # with unread payload instead of returning them to the pool.
+            await resp.read()
+            logger.debug(f"Appended content to session {session_id}")
             return True
     except Exception as e:
         err_text = f"Error appending to remote transcription session: {e}"
         logger.exception(err_text)
-        try:
-            await send_frontend_message(task, text=err_text, user_message=False, level="error")
-        except Exception:
-            logger.exception("Failed to queue append exception frame")
+        await send_frontend_message(task, text=err_text, user_message=False, level="error")
         return False
 
 
+# How long to wait for queued appends to reach confai when the client leaves
+_APPEND_FLUSH_TIMEOUT_SECS = 15.0
+
+
+async def _append_worker(task: PipelineTask):
+    """Drain `task._append_queue` and append its content to confai.
+
+    Everything queued while a request is in flight is joined with newlines
+    and sent as a single append, so the pipeline never waits on confai.
+    """
+    queue = task._append_queue
+    while True:
+        items = [await queue.get()]
+        while not queue.empty():
+            items.append(queue.get_nowait())
+        try:
+            await append_confai_transcription(task, task._session_id, "\n".join(items))
+        except Exception:
+            logger.exception("‼️ Error while appending transcription to confai")
+        finally:
+            for _ in items:
+                queue.task_done()
+
 
 class TranscriptDisplayProcessor(FrameProcessor):
     """Elküldi a transzkripciókat a WebRTC felületre."""
-    
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Attached in `run_bot` once the PipelineTask exists
+        self._task: PipelineTask | None = None
+
+    async def _handle_transcription(self, frame: TranscriptionFrame):
+        # Formázott szöveg a felületre
+        text = f"🎤 {frame.text}"
+
+        # Per-frame logs pass their values as loguru arguments instead of
+        # f-strings: loguru only formats the message if the level is enabled.
+        logger.info("✅ TranscriptionFrame észlelve: {}", frame.text)
+
+        # OutputTransportMessageFrame küldése a böngésző felületére. The message
+        # dict is built per frame on purpose: the output transport serializes it
+        # later from its own queue, so a reused (mutated) dict could change the
+        # text of frames that haven't been sent yet.
+        message_frame = OutputTransportMessageFrame(message={"text": text, "type": "chat"})
+        logger.info("📤 OutputTransportMessageFrame küldése: {}", text)
+        await self.push_frame(message_frame, FrameDirection.DOWNSTREAM)
+
+        # Queue the raw transcribed content for the confai append worker
+        task = self._task
+        if task is None or task._session_id is None:
+            logger.debug("‼️ No confai session yet; skipping confai append")
+            return
+        # Send the raw transcription text (without emoji prefix)
+        task._append_queue.put_nowait(frame.text)
+
+    # Exact frame type -> handler. Most frames (audio, VAD, ...) miss the
+    # lookup and are just forwarded.
+    _HANDLERS = {TranscriptionFrame: _handle_transcription}
+
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
-                
-        # TranscriptionFrame közvetlenül az STT-től
-        if isinstance(frame, TranscriptionFrame):
-            # Formázott szöveg a felületre
-            text = f"🎤 {frame.text}"
-            
-            logger.info(f"✅ TranscriptionFrame észlelve: {frame.text}")
-            
-            # OutputTransportMessageFrame küldése a böngésző felületére
-            message_frame = OutputTransportMessageFrame(message={"text": text, "type": "chat"})
-            logger.info(f"📤 OutputTransportMessageFrame küldése: {text}")
-            await self.push_frame(message_frame, FrameDirection.DOWNSTREAM)
-            
-            user_frame = UserTextFrame(text=text)
-            logger.info(f"📤 UserTextFrame küldése: {text}")
-            await self.push_frame(user_frame, FrameDirection.DOWNSTREAM)
-            # Append the raw transcribed content to remote confai session if available
-            try:
-                if hasattr(self, "_task") and self._task:
-                    # Send the raw transcription text (without emoji prefix)
-                    await append_confai_transcription(self._task, frame.text)
-                else:
-                    logger.debug("‼️ No task attached to TranscriptDisplayProcessor; skipping confai append")
-            except Exception:
-                logger.exception("‼️ Error while appending transcription to confai")
-        
+
+        handler = self._HANDLERS.get(type(frame))
+        if handler is not None:
+            await handler(self, frame)
+
         # Továbbítjuk az eredeti frame-et is
         await self.push_frame(frame, direction)
 
@@ -308,47 +449,60 @@ class TranscriptDisplayProcessor(FrameProcessor):
 class TranscriptionLogger(FrameProcessor):
     """Egyszerű logger a transzkripciók konzolra írásához."""
 
+    async def _handle_transcription(self, frame: TranscriptionFrame):
+        logger.info("📝 {}: {}", frame.user_id or "user", frame.text)
+
+    async def _handle_transcription_update(self, frame: TranscriptionUpdateFrame):
+        for msg in frame.messages:
+            if isinstance(msg, TranscriptionMessage):
+                if msg.timestamp:
+                    logger.info("📝 [{}] {}: {}", msg.timestamp, msg.role, msg.content)
+                else:
+                    logger.info("📝 {}: {}", msg.role, msg.content)
+
+    # Same exact-type dispatch as TranscriptDisplayProcessor: every other frame
+    # costs a single dict miss before being forwarded.
+    _HANDLERS = {
+        TranscriptionFrame: _handle_transcription,
+        TranscriptionUpdateFrame: _handle_transcription_update,
+    }
+
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
-        # Ha TranscriptionFrame érkezik
-        if isinstance(frame, TranscriptionFrame):
-            logger.info(f"📝 {frame.user_id or 'user'}: {frame.text}")
-
-        # Ha TranscriptionUpdateFrame (több üzenet) érkezik
-        if isinstance(frame, TranscriptionUpdateFrame):
-            for msg in frame.messages:
-                if isinstance(msg, TranscriptionMessage):
-                    timestamp = f"[{msg.timestamp}] " if msg.timestamp else ""
-                    logger.info(f"📝 {timestamp}{msg.role}: {msg.content}")
+        handler = self._HANDLERS.get(type(frame))
+        if handler is not None:
+            await handler(self, frame)
 
         # Továbbítjuk az eredeti frame-et
         await self.push_frame(frame, direction)
 
 
 # Transport paraméterek - csak audio input és text output
+_TRANSPORT_KWARGS = dict(
+    audio_in_enabled=True,
+    audio_out_enabled=False,  # Nincs bot audio
+    video_out_enabled=False,  # Nincs bot video
+    text_output_enabled=True,  # Text output a transkripcióhoz
+)
+
+
+def _create_vad_analyzer() -> SileroVADAnalyzer:
+    # Each transport needs its own analyzer (it keeps per-stream state); the
+    # ONNX session itself is shared by SileroVADAnalyzer.
+    return SileroVADAnalyzer(
+        params=VADParams(stop_secs=0.5),
+        model_path=os.getenv("SILERO_VAD_MODEL_PATH"),
+        use_openvino=os.getenv("SILERO_VAD_BACKEND", "").lower() == "openvino",
+    )
+
+
 transport_params = {
-    "daily": lambda: DailyParams(
-        audio_in_enabled=True,
-        audio_out_enabled=False,  # Nincs bot audio
-        video_out_enabled=False,  # Nincs bot video
-        text_output_enabled=True,  # Text output a transkripcióhoz
-        vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.5)),
-    ),
+    "daily": lambda: DailyParams(**_TRANSPORT_KWARGS, vad_analyzer=_create_vad_analyzer()),
     "twilio": lambda: FastAPIWebsocketParams(
-        audio_in_enabled=True,
-        audio_out_enabled=False,  # Nincs bot audio
-        video_out_enabled=False,  # Nincs bot video
-        text_output_enabled=True,  # Text output a transkripcióhoz
-        vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.5)),
-    ),
-    "webrtc": lambda: TransportParams(
-        audio_in_enabled=True,
-        audio_out_enabled=False,  # Nincs bot audio
-        video_out_enabled=False,  # Nincs bot video
-        text_output_enabled=True,  # Text output a transkripcióhoz
-        vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.5)),
+        **_TRANSPORT_KWARGS, vad_analyzer=_create_vad_analyzer()
     ),
+    "webrtc": lambda: TransportParams(**_TRANSPORT_KWARGS, vad_analyzer=_create_vad_analyzer()),
 }
 
 
@@ -389,6 +543,22 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
         idle_timeout_secs=runner_args.pipeline_idle_timeout_secs,
     )
 
+    # Remote confai session, set by `start_confai_transcription`
+    task._session_id = None
+    task._confai_ws = None
+    task._confai_ws_reader = None
+
+    # Shared HTTP session for the confai helpers so every append reuses the
+    # same pooled connection instead of doing a new TCP+TLS handshake.
+    task._http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=10, sock_connect=5),
+    )
+
+    # Transcriptions are appended to confai in the background (see `_append_worker`)
+    task._append_queue = asyncio.Queue()
+    append_worker = asyncio.create_task(_append_worker(task))
+
     # Make the task available to processors so they can access session info
     # (used by confai helpers: start/finalize/append)
     try:
@@ -408,7 +578,13 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
     @transport.event_handler("on_client_disconnected")
     async def on_client_disconnected(transport, client):
         logger.info("❌ Kliens lecsatlakozott")
-        # Attempt to finalize remote transcription session before cancelling
+        # Flush pending appends, then finalize remote transcription session before cancelling
+        try:
+            # Bounded, so a slow confai can't hold up the disconnect forever.
+            await asyncio.wait_for(task._append_queue.join(), timeout=_APPEND_FLUSH_TIMEOUT_SECS)
+        except asyncio.TimeoutError:
+            logger.warning("Timed out flushing pending confai appends; finalizing anyway")
+        append_worker.cancel()
         try:
             await finalize_confai_transcription(task)
         except Exception:
@@ -418,7 +594,19 @@ async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
 
     runner = PipelineRunner(handle_sigint=runner_args.handle_sigint)
 
-    await runner.run(task)
+    try:
+        await runner.run(task)
+    finally:
+        # The pipeline can also end without a client disconnect (SIGINT, idle
+        # timeout, failed confai start), so stop the append worker and release
+        # the append stream and HTTP session here.
+        append_worker.cancel()
+        try:
+            await append_worker
+        except asyncio.CancelledError:
+            pass
+        await _close_confai_stream(task)
+        await task._http.close()
 
 
 async def bot(runner_args: RunnerArguments):
@@ -430,4 +618,13 @@ async def bot(runner_args: RunnerArguments):
 if __name__ == "__main__":
     from pipecat.runner.run import main
 
+    # Use uvloop when it's available (it isn't on Windows). uvicorn already
+    # picks it up on its own; this also covers the direct `asyncio.run()` path.
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ModuleNotFoundError:
+        logger.debug("uvloop not installed, using the default asyncio event loop")
+
     main()
@@ -11,6 +11,7 @@ which can detect voice activity in audio streams with high accuracy.
 Supports 8kHz and 16kHz sample rates.
 """
 
+import functools
 import time
 from typing import Optional
 
@@ -31,32 +32,67 @@ except ModuleNotFoundError as e:
     raise Exception(f"Missing module(s): {e}")
 
 
+@functools.lru_cache(maxsize=None)
+def _load_session(
+    path: str, force_onnx_cpu: bool, use_openvino: bool
+) -> "onnxruntime.InferenceSession":
+    """Load an ONNX inference session, shared by all models using the same file.
+
+    The session only holds the (read-only) model weights and `run()` is
+    thread-safe, so every stream can use the same session while keeping its
+    own recurrent state in `SileroOnnxModel`. `use_openvino` must only be set
+    when the OpenVINO execution provider is available.
+    """
+    opts = onnxruntime.SessionOptions()
+    opts.inter_op_num_threads = 1
+    opts.intra_op_num_threads = 1
+
+    if use_openvino:
+        return onnxruntime.InferenceSession(
+            path,
+            providers=["OpenVINOExecutionProvider", "CPUExecutionProvider"],
+            provider_options=[{"device_type": "CPU"}, {}],
+            sess_options=opts,
+        )
+
+    if force_onnx_cpu and "CPUExecutionProvider" in onnxruntime.get_available_providers():
+        return onnxruntime.InferenceSession(
+            path, providers=["CPUExecutionProvider"], sess_options=opts
+        )
+    else:
+        return onnxruntime.InferenceSession(path, sess_options=opts)
+
+
 class SileroOnnxModel:
     """ONNX runtime wrapper for the Silero VAD model.
 
     Provides voice activity detection using the pre-trained Silero VAD model
     with ONNX runtime for efficient inference. Handles model state management
-    and input validation for audio processing.
+    and input validation for audio processing. The underlying ONNX session is
+    shared between instances loading the same model file.
     """
 
-    def __init__(self, path, force_onnx_cpu=True):
+    def __init__(self, path, force_onnx_cpu=True, use_openvino=False):
         """Initialize the Silero ONNX model.
 
         Args:
             path: Path to the ONNX model file.
             force_onnx_cpu: Whether to force CPU execution provider.
+            use_openvino: Whether to use the OpenVINO execution provider
+                (Intel CPUs) when it's available.
         """
-        opts = onnxruntime.SessionOptions()
-        opts.inter_op_num_threads = 1
-        opts.intra_op_num_threads = 1
-
-        if force_onnx_cpu and "CPUExecutionProvider" in onnxruntime.get_available_providers():
-            self.session = onnxruntime.InferenceSession(
-                path, providers=["CPUExecutionProvider"], sess_options=opts
+        if use_openvino and (
+            "OpenVINOExecutionProvider" not in onnxruntime.get_available_providers()
+        ):
+            logger.warning(
+                "OpenVINO execution provider requested for Silero VAD but it's not available "
+                "(`pip install onnxruntime-openvino`), using default providers"
             )
-        else:
-            self.session = onnxruntime.InferenceSession(path, sess_options=opts)
+            use_openvino = False
 
+        # Resolve the provider before the cached call so the fallback shares
+        # the default session instead of loading another copy of the model.
+        self.session = _load_session(str(path), force_onnx_cpu, use_openvino)
         self.reset_states()
         self.sample_rates = [8000, 16000]
 
@@ -84,6 +120,7 @@ class SileroOnnxModel:
         """
         self._state = np.zeros((2, batch_size, 128), dtype="float32")
         self._context = np.zeros((batch_size, 0), dtype="float32")
+        self._sr_input = None
         self._last_sr = 0
         self._last_batch_size = 0
 
@@ -109,11 +146,13 @@ class SileroOnnxModel:
 
         if not np.shape(self._context)[1]:
             self._context = np.zeros((batch_size, context_size), dtype="float32")
+        if self._sr_input is None:
+            self._sr_input = np.array(sr, dtype="int64")
 
         x = np.concatenate((self._context, x), axis=1)
 
         if sr in [8000, 16000]:
-            ort_inputs = {"input": x, "state": self._state, "sr": np.array(sr, dtype="int64")}
+            ort_inputs = {"input": x, "state": self._state, "sr": self._sr_input}
             ort_outs = self.session.run(None, ort_inputs)
             out, state = ort_outs
             self._state = state
@@ -135,34 +174,52 @@ class SileroVADAnalyzer(VADAnalyzer):
     with automatic model state management and periodic resets.
     """
 
-    def __init__(self, *, sample_rate: Optional[int] = None, params: Optional[VADParams] = None):
+    def __init__(
+        self,
+        *,
+        sample_rate: Optional[int] = None,
+        params: Optional[VADParams] = None,
+        model_path: Optional[str] = None,
+        use_openvino: bool = False,
+    ):
         """Initialize the Silero VAD analyzer.
 
         Args:
             sample_rate: Audio sample rate (8000 or 16000 Hz). If None, will be set later.
             params: VAD parameters for detection thresholds and timing.
+            model_path: Path to a Silero VAD ONNX model file (e.g. an int8
+                quantized export). If this is not set, the bundled model will
+                be used.
+            use_openvino: Whether to run the model on the ONNX Runtime OpenVINO
+                execution provider (Intel CPUs). Requires `onnxruntime-openvino`,
+                falls back to the default providers otherwise. Defaults to False.
         """
         super().__init__(sample_rate=sample_rate, params=params)
 
         logger.debug("Loading Silero VAD model...")
 
-        model_name = "silero_vad.onnx"
-        package_path = "pipecat.audio.vad.data"
-
-        try:
-            import importlib_resources as impresources
-
-            model_file_path = str(impresources.files(package_path).joinpath(model_name))
-        except BaseException:
-            from importlib import resources as impresources
+        model_file_path = model_path
+        if not model_file_path:
+            # Load bundled model
+            model_name = "silero_vad.onnx"
+            package_path = "pipecat.audio.vad.data"
 
             try:
-                with impresources.path(package_path, model_name) as f:
-                    model_file_path = f
-            except BaseException:
+                import importlib_resources as impresources
+
                 model_file_path = str(impresources.files(package_path).joinpath(model_name))
+            except BaseException:
+                from importlib import resources as impresources
+
+                try:
+                    with impresources.path(package_path, model_name) as f:
+                        model_file_path = f
+                except BaseException:
+                    model_file_path = str(impresources.files(package_path).joinpath(model_name))
 
-        self._model = SileroOnnxModel(model_file_path, force_onnx_cpu=True)
+        self._model = SileroOnnxModel(
+            model_file_path, force_onnx_cpu=True, use_openvino=use_openvino
+        )
 
         self._last_reset_time = 0
 
@@ -206,9 +263,8 @@ class SileroVADAnalyzer(VADAnalyzer):
             Voice confidence score between 0.0 and 1.0.
         """
         try:
-            audio_int16 = np.frombuffer(buffer, np.int16)
             # Divide by 32768 because we have signed 16-bit data.
-            audio_float32 = np.frombuffer(audio_int16, dtype=np.int16).astype(np.float32) / 32768.0
+            audio_float32 = np.frombuffer(buffer, dtype=np.int16).astype(np.float32) / 32768.0
             new_confidence = self._model(audio_float32, self.sample_rate)[0]
 
             # We need to reset the model from time to time because it doesn't
@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import os
+import shutil
+import tempfile
+import unittest
+from importlib import resources
+from unittest.mock import patch
+
+try:
+    import onnxruntime
+
+    from pipecat.audio.vad.silero import SileroVADAnalyzer, _load_session
+except ModuleNotFoundError:
+    SileroVADAnalyzer = None
+
+_CPU_PROVIDERS = ["CPUExecutionProvider"]
+
+
+@unittest.skipIf(SileroVADAnalyzer is None, "onnxruntime is not installed")
+class TestSileroVADAnalyzer(unittest.TestCase):
+    def test_instances_share_session(self):
+        vad1 = SileroVADAnalyzer()
+        vad2 = SileroVADAnalyzer()
+        self.assertIs(vad1._model.session, vad2._model.session)
+
+    def test_instances_do_not_share_state(self):
+        vad1 = SileroVADAnalyzer()
+        vad2 = SileroVADAnalyzer()
+        self.assertIsNot(vad1._model._state, vad2._model._state)
+        self.assertIsNot(vad1._model._context, vad2._model._context)
+
+    def test_model_path_gets_own_session(self):
+        bundled = resources.files("pipecat.audio.vad.data").joinpath("silero_vad.onnx")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model_path = os.path.join(tmp_dir, "silero_vad_copy.onnx")
+            with resources.as_file(bundled) as bundled_path:
+                shutil.copyfile(bundled_path, model_path)
+
+            default_vad = SileroVADAnalyzer()
+            custom_vad = SileroVADAnalyzer(model_path=model_path)
+            other_custom_vad = SileroVADAnalyzer(model_path=model_path)
+
+            self.assertIsNot(default_vad._model.session, custom_vad._model.session)
+            self.assertIs(custom_vad._model.session, other_custom_vad._model.session)
+
+    def test_use_openvino_falls_back_to_default_session(self):
+        with (
+            patch.object(onnxruntime, "get_available_providers", return_value=_CPU_PROVIDERS),
+            patch("pipecat.audio.vad.silero.logger") as mock_logger,
+        ):
+            default_vad = SileroVADAnalyzer()
+            vad = SileroVADAnalyzer(use_openvino=True)
+
+        mock_logger.warning.assert_called_once()
+        self.assertEqual(vad._model.session.get_providers(), ["CPUExecutionProvider"])
+        self.assertIs(vad._model.session, default_vad._model.session)
+
+    def test_use_openvino_with_provider_available(self):
+        providers = ["OpenVINOExecutionProvider", *_CPU_PROVIDERS]
+        _load_session.cache_clear()
+        try:
+            with (
+                patch.object(onnxruntime, "get_available_providers", return_value=providers),
+                patch.object(onnxruntime, "InferenceSession") as mock_session,
+            ):
+                vad = SileroVADAnalyzer(use_openvino=True)
+
+            mock_session.assert_called_once()
+            kwargs = mock_session.call_args.kwargs
+            self.assertEqual(
+                kwargs["providers"], ["OpenVINOExecutionProvider", "CPUExecutionProvider"]
+            )
+            self.assertEqual(kwargs["provider_options"], [{"device_type": "CPU"}, {}])
+            self.assertIs(vad._model.session, mock_session.return_value)
+        finally:
+            # Don't leave the mocked session in the cache for other tests.
+            _load_session.cache_clear()
+
+
+if __name__ == "__main__":
+    unittest.main()